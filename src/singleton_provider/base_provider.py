@@ -31,8 +31,8 @@ Example:
     ```
 """
 import logging
-from abc import ABC
-from collections import defaultdict
+import threading
+import weakref
 
 from .exceptions import (
     CircularDependencyError,
@@ -42,8 +42,31 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Traversal states of a provider in the dependency graph walk
+_IN_PROGRESS = 1
+_DONE = 2
 
-class BaseProvider(ABC):
+# Providers that directly depend on a given provider. Used to refresh their
+# initialization order when @requires changes the provider's dependencies.
+# Weak on both sides, so that the registry never keeps a provider alive.
+_dependents: weakref.WeakKeyDictionary[
+    type["BaseProvider"], weakref.WeakSet[type["BaseProvider"]]
+] = weakref.WeakKeyDictionary()
+
+# Providers whose initialize() method is currently running in this thread
+_initializing = threading.local()
+
+
+def _get_initializing_stack() -> list[type["BaseProvider"]]:
+    """Return the stack of providers being initialized in the current thread."""
+    try:
+        return _initializing.stack
+    except AttributeError:
+        _initializing.stack = []
+        return _initializing.stack
+
+
+class BaseProvider:
     """Base class for all singleton providers.
     
     This class implements the singleton pattern by preventing instantiation and providing
@@ -54,7 +77,12 @@ class BaseProvider(ABC):
     
     Attributes:
         _initialized: Whether this provider has been successfully initialized.
-        _dependencies: Set of other providers this provider depends on.
+        _dependencies: Other providers this provider directly depends on, in the order
+            they were declared.
+        _initialization_order: This provider and all of its dependencies,
+            ordered for safe initialization. Computed when the class is defined.
+        _initialization_lock: Lock serializing the initialization of this provider
+            across threads. Each provider has its own.
     
     Note:
         Providers cannot be instantiated. Attempting to create an instance will raise a RuntimeError.
@@ -84,7 +112,27 @@ class BaseProvider(ABC):
         ```
     """
     _initialized: bool = False
-    _dependencies: set[type["BaseProvider"]] = set()
+    _dependencies: tuple[type["BaseProvider"], ...] = ()
+    _initialization_order: tuple[type["BaseProvider"], ...] = ()
+    _initialization_lock: threading.RLock = threading.RLock()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Compute the initialization order and create the lock of the new provider.
+        
+        Dependencies are known as soon as the class is defined, so the order
+        is computed once here instead of on every first access. `@requires`
+        recomputes it after replacing the dependencies.
+        
+        Raises:
+            CircularDependencyError: If the inherited dependencies form a cycle.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._initialization_order = cls._get_initialization_order()
+        # Re-entrant because initialize() may call guarded methods of
+        # providers whose initialization order includes this one
+        cls._initialization_lock = threading.RLock()
+        for dep in cls._dependencies:
+            _dependents.setdefault(dep, weakref.WeakSet()).add(cls)
 
     def __new__(cls, *args, **kwargs) -> "BaseProvider":
         """Prevent instantiation of singleton providers.
@@ -199,121 +247,138 @@ class BaseProvider(ABC):
         return True
 
     @classmethod
-    def _get_all_dependencies(cls) -> set[type["BaseProvider"]]:
-        """Get all dependencies recursively for this provider.
-        
-        This internal method traverses the dependency graph to find all providers
-        that this provider depends on, directly or indirectly.
-        
-        Returns:
-            set[type[BaseProvider]]: All providers in the dependency tree.
-            
-        Note:
-            This is an internal method used by the framework for dependency resolution.
-            It performs a depth-first traversal of the dependency graph.
-        """
-        deps = set(cls._dependencies)
-        for dep in cls._dependencies:
-            deps.update(dep._get_all_dependencies())
-        return deps
-
-    @classmethod
-    def _raise_on_circular_dependencies(
+    def _get_initialization_order(
         cls,
-        visited: set[type["BaseProvider"]] | None = None,
-        recursion_stack: set[type["BaseProvider"]] | None = None,
-    ) -> None:
-        """Check for circular dependencies using depth-first search.
+        dependencies: tuple[type["BaseProvider"], ...] | None = None,
+    ) -> tuple[type["BaseProvider"], ...]:
+        """Determine the correct initialization order using topological sort.
         
-        This method performs cycle detection in the dependency graph using DFS.
-        If a circular dependency is found, it raises an exception with details
-        about the providers involved in the cycle.
+        This method analyzes the dependency graph and returns providers in the order
+        they should be initialized, ensuring that dependencies are always initialized
+        before the providers that depend on them.
         
         Args:
-            visited: Set of providers already visited during traversal.
-            recursion_stack: Current path in the DFS traversal.
+            dependencies: Direct dependencies to use for this provider instead of
+                `_dependencies`. Allows validating new dependencies before they
+                are assigned to the class.
+        
+        Returns:
+            tuple[type[BaseProvider], ...]: Providers ordered for safe initialization.
             
         Raises:
-            CircularDependencyError: If a circular dependency is detected.
+            CircularDependencyError: If the dependency graph contains cycles.
             
         Note:
-            This is an internal method used by the framework before initialization.
-            The algorithm uses DFS with a recursion stack to detect back edges,
-            which indicate cycles in the dependency graph.
+            This is an internal method that walks the dependency graph exactly once
+            using an iterative depth-first search. A dependency found on the current
+            DFS path is a back edge and indicates a cycle. Each provider is appended
+            to the order once all of its dependencies have been explored (post-order),
+            so dependencies always come before their dependents. The result is stored
+            in `_initialization_order` when the provider class is defined.
         """
-        if visited is None:
-            visited = set()
-        if recursion_stack is None:
-            recursion_stack = set()
+        if dependencies is None:
+            dependencies = cls._dependencies
 
-        if cls in recursion_stack:
-            raise CircularDependencyError(
-                f"Circular dependency in {cls.__name__}: "
-                f"{', '.join([d.__name__ for d in recursion_stack])}"
-            )
+        # Leaf providers are common and need no graph traversal at all
+        if not dependencies:
+            return (cls,)
 
-        if cls in visited:
-            return
+        # A provider is absent from `state` until it is first reached
+        state: dict[type["BaseProvider"], int] = {cls: _IN_PROGRESS}
+        stack = [(cls, iter(dependencies))]
+        result = []
 
-        visited.add(cls)
-        recursion_stack.add(cls)
+        while stack:
+            provider, deps = stack[-1]
+            dep = next(deps, None)
 
-        for dep in cls._dependencies:
-            dep._raise_on_circular_dependencies(visited, recursion_stack)
+            if dep is None:
+                # All dependencies of this provider are already in the order
+                stack.pop()
+                state[provider] = _DONE
+                result.append(provider)
+                continue
 
-        recursion_stack.remove(cls)
+            dep_state = state.get(dep)
+            if dep_state == _IN_PROGRESS:
+                # The cycle is the part of the current path starting at `dep`
+                path = [p for p, _ in stack]
+                cycle = path[path.index(dep):] + [dep]
+                raise CircularDependencyError(
+                    f"Circular dependency in {dep.__name__}: "
+                    f"{' -> '.join(p.__name__ for p in cycle)}"
+                )
+            if dep_state == _DONE:
+                continue
+
+            state[dep] = _IN_PROGRESS
+            stack.append((dep, iter(dep._dependencies)))
+
+        return tuple(result)
 
     @classmethod
-    def _get_initialization_order(cls) -> list[type["BaseProvider"]]:
-        """Determine the correct initialization order using topological sort.
+    def _set_dependencies(
+        cls,
+        dependencies: tuple[type["BaseProvider"], ...],
+    ) -> None:
+        """Replace the direct dependencies of this provider.
         
-        This method analyzes the dependency graph and returns providers in the order
-        they should be initialized, ensuring that dependencies are always initialized
-        before the providers that depend on them.
+        Recomputes the initialization order of this provider and of every provider
+        affected by the change: providers that depend on it, directly or transitively,
+        and subclasses that inherit its dependencies.
         
-        Returns:
-            list[type[BaseProvider]]: Providers ordered for safe initialization.
+        Args:
+            dependencies: New direct dependencies of this provider.
             
         Raises:
-            CircularDependencyError: If the dependency graph contains cycles.
+            CircularDependencyError: If the new dependencies form a cycle. In that
+            case no provider is modified.
             
         Note:
-            This is an internal method that implements Kahn's algorithm for topological sorting.
-            The algorithm builds a dependency graph and processes nodes with no incoming edges,
-            ensuring a valid initialization order.
+            This is an internal method used by the @requires decorator.
         """
-        # Build dependency graph
-        graph = defaultdict(set)
-        in_degree = defaultdict(int)
-
-        # Add all dependencies to the graph
-        all_deps = cls._get_all_dependencies()
-        all_deps.add(cls)
-
-        for provider in all_deps:
-            for dep in provider._dependencies:
-                graph[dep].add(provider)
-                in_degree[provider] += 1
-
-        # Topological sort
-        result = []
-        queue = [p for p in all_deps if in_degree[p] == 0]
+        # Fail fast without modifying anything if this provider becomes cyclic
+        order = cls._get_initialization_order(dependencies)
 
-        while queue:
-            provider = queue.pop(0)
-            result.append(provider)
+        # Collect every provider whose initialization order depends on this one
+        affected: list[type["BaseProvider"]] = []
+        seen = {cls}
+        pending = [cls]
+        while pending:
+            provider = pending.pop()
+            inheriting = [
+                sub for sub in provider.__subclasses__()
+                if "_dependencies" not in sub.__dict__
+            ]
+            for other in (*_dependents.get(provider, ()), *inheriting):
+                if other not in seen:
+                    seen.add(other)
+                    affected.append(other)
+                    pending.append(other)
 
-            for dependent in graph[provider]:
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
+        previous = {p: p._dependencies for p in (cls, *affected)}
+        had_own_dependencies = "_dependencies" in cls.__dict__
+        cls._dependencies = dependencies
+        try:
+            orders = {p: p._get_initialization_order() for p in affected}
+        except CircularDependencyError:
+            # Subclasses inheriting the new dependencies may still form a cycle
+            if had_own_dependencies:
+                cls._dependencies = previous[cls]
+            else:
+                del cls._dependencies
+            raise
 
-        if len(result) != len(all_deps):
-            raise CircularDependencyError(
-                "Circular dependency detected in the dependency graph"
-            )
+        cls._initialization_order = order
+        for provider, provider_order in orders.items():
+            provider._initialization_order = provider_order
 
-        return result
+        # Keep the dependents registry in sync with the new dependencies
+        for provider, old_dependencies in previous.items():
+            for dep in old_dependencies:
+                _dependents.get(dep, set()).discard(provider)
+            for dep in provider._dependencies:
+                _dependents.setdefault(dep, weakref.WeakSet()).add(provider)
 
     @classmethod
     def _initialize_impl(cls) -> None:
@@ -335,26 +400,33 @@ class BaseProvider(ABC):
             This is an internal method called by the @guarded decorator.
             It should not be called directly by user code.
         """
-        logger.debug(f"Initializing {cls.__name__} provider...")
-        cls.initialize()
-        logger.debug(f"Provider {cls.__name__} initialized")
-
-        # Verify that the provider is correctly initialized
-        logger.debug(f"Pinging {cls.__name__} provider...")
+        logger.debug("Initializing %s provider...", cls.__name__)
+        initializing = _get_initializing_stack()
+        initializing.append(cls)
         try:
-            ping_result = cls.ping()
-        except Exception as e:
-            raise ProviderInitializationError(
-                f"Provider {cls.__name__} failed to initialize "
-                f"because its ping method raised an exception: {e}"
-            ) from e
-
-        if not ping_result:
-            raise ProviderInitializationError(
-                f"Provider {cls.__name__} failed to initialize "
-                "because its ping method did not return True"
-            )
+            cls.initialize()
+        finally:
+            initializing.pop()
+        logger.debug("Provider %s initialized", cls.__name__)
+
+        # Verify that the provider is correctly initialized. The default
+        # ping() always succeeds, so it is only called when overridden.
+        if getattr(cls.ping, "__func__", None) is not BaseProvider.ping.__func__:
+            logger.debug("Pinging %s provider...", cls.__name__)
+            try:
+                ping_result = cls.ping()
+            except Exception as e:
+                raise ProviderInitializationError(
+                    f"Provider {cls.__name__} failed to initialize "
+                    f"because its ping method raised an exception: {e}"
+                ) from e
+
+            if not ping_result:
+                raise ProviderInitializationError(
+                    f"Provider {cls.__name__} failed to initialize "
+                    "because its ping method did not return True"
+                )
         
         # Mark the provider as initialized
-        logger.info(f"Provider {cls.__name__} initialized successfully")
+        logger.info("Provider %s initialized successfully", cls.__name__)
         cls._initialized = True
@@ -30,18 +30,16 @@ Example:
 """
 import inspect
 import logging
-from collections.abc import Awaitable, Callable, Coroutine
+from collections.abc import Callable
 from functools import wraps
 from typing import (
     Any,
     TypeVar,
     ParamSpec,
     Concatenate,
-    overload,
-    cast,
 )
 
-from .base_provider import BaseProvider
+from .base_provider import BaseProvider, _get_initializing_stack
 from .exceptions import (
     ProviderInitializationError,
     SelfDependencyError,
@@ -69,10 +67,14 @@ def requires(
         *dependencies: Variable number of provider classes that this provider
         depends on. Each must be a subclass of BaseProvider.
         
+    Raises:
+        CircularDependencyError: If the dependencies form a cycle.
+        
     Note:
-        - Circular dependencies will be detected and raise CircularDependencyError
+        - Circular dependencies are detected when the decorator is applied
         - Dependencies are initialized recursively (dependencies of dependencies)
-        - The order of dependencies in the decorator doesn't matter
+        - Dependencies are always initialized before the provider; independent
+          dependencies are initialized in the order they are declared
     
     Example:
 
@@ -104,7 +106,10 @@ def requires(
         ```
     """
     def decorator(cls: _BaseProviderT) -> _BaseProviderT:
-        cls._dependencies = set(dependencies)
+        # Deduplicate while keeping the declaration order, so that independent
+        # dependencies are always initialized in the same, predictable order.
+        # Providers that already depend on this one get their order refreshed.
+        cls._set_dependencies(tuple(dict.fromkeys(dependencies)))
         return cls
 
     return decorator
@@ -120,15 +125,141 @@ class Guarded(classmethod):
 
     __func__: Callable[..., Any]
 
-    def __init__(self, func: Callable[..., Any], /) -> None:
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        /,
+        is_coroutine: bool = False,
+    ) -> None:
         super().__init__(func)
-        if inspect.iscoroutinefunction(func):
+        if is_coroutine:
             self._is_coroutine = True
 
     def __call__(self, *args: Any, **kwargs: Any):
         return self.__func__(*args, **kwargs)
 
 
+def _validate(
+    cls: type[_T],
+    method: Callable[Concatenate[type[_T], _P], _R],
+) -> None:
+    """Ensure the guarded method is called on a provider it belongs to.
+
+    Raises:
+        `ValueError`: If the function is not a method of the class
+        or the class is not a subclass of BaseProvider.
+    """
+    if not issubclass(cls, BaseProvider):
+        raise ValueError(
+            f"Class '{cls.__name__}' for the method "
+            f"{method.__qualname__} is not a subclass of BaseProvider."
+        ) 
+
+    # Ensure the function is actually part of this class. This check is
+    # important because __qualname__ could be misleading if a function
+    # is defined inside another function within a class, though that's a
+    # rare case for methods. We're assuming decorated functions are
+    # direct attributes of the class or its instances.
+    if not hasattr(cls, method.__name__):
+        raise ValueError(
+            f"Function {method.__qualname__} is not a method of "
+            f"class {cls.__name__}."
+        )
+
+
+def _raise_on_self_dependency(
+    cls: type,
+    method: Callable[..., Any],
+) -> None:
+    if cls in _get_initializing_stack():
+        raise SelfDependencyError(
+            f"Guarded method {method.__qualname__} was invoked "
+            "inside the initialize() method of its class "
+            f"{cls.__name__}. Guarded methods cannot "
+            "be called from the initialize() method."
+        )
+
+
+def _initialize_all(
+    cls: _BaseProviderT,
+    method: Callable[..., Any],
+    requested_for: str | None = None,
+) -> None:
+    if cls._initialized:
+        return
+    logger.debug(
+        "Singleton %s requires initialization%s",
+        cls.__name__,
+        f" for {requested_for}" if requested_for else "",
+    )
+    # Raise an error if the @guarded decorator function is called
+    # from the initialize method of the provider.
+    _raise_on_self_dependency(cls, method)
+
+    # Make sure all dependencies of this provider are initialized
+    init_order = cls._initialization_order
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Initialization order for %s is %s",
+            cls.__name__,
+            ", ".join(provider.__name__ for provider in init_order),
+        )
+    for dep in init_order:
+        if dep._initialized:
+            logger.debug(
+                "Dependency %s of %s is already initialized",
+                dep.__name__,
+                cls.__name__,
+            )
+            continue
+        # Double-checked locking on the provider's own lock, so that threads
+        # only wait for the providers they actually need.
+        with dep._initialization_lock:
+            if dep._initialized:
+                continue
+            try:
+                dep._initialize_impl()
+            except Exception as e:
+                who = cls.__name__
+                why = dep.__name__
+                cause = f" because of {why}" if who != why else ""
+                raise ProviderInitializationError(
+                    f"Failed to initialize {who}{cause}: {e}"
+                ) from e
+
+
+def _wrap(
+    f: Callable[Concatenate[type[_T], _P], _R],
+    is_coroutine: bool,
+) -> Callable[Concatenate[type[_T], _P], _R]:
+    if is_coroutine:
+        @wraps(f)
+        async def async_wrapper(
+            cls: _BaseProviderT, *args: _P.args, **kwargs: _P.kwargs
+        ) -> _R:  # type: ignore[override]
+            # Validation can only fail before the first successful call, so
+            # the already initialized provider skips straight to the method.
+            if not getattr(cls, "_initialized", False):
+                _validate(cls, f)
+                _initialize_all(cls, f)
+            return await f(cls, *args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(f)
+    def sync_wrapper(
+        cls: _BaseProviderT, *args: _P.args, **kwargs: _P.kwargs
+    ) -> _R:  # type: ignore[override]
+        # Validation can only fail before the first successful call, so
+        # the already initialized provider skips straight to the method.
+        if not getattr(cls, "_initialized", False):
+            _validate(cls, f)
+            _initialize_all(cls, f)
+        return f(cls, *args, **kwargs)
+
+    return sync_wrapper  # type: ignore[return-value]
+
+
 def guarded(
     func: Callable[Concatenate[type[_T], _P], _R] | classmethod,
     /,
@@ -149,7 +280,6 @@ def guarded(
     Raises:
         ProviderInitializationError: If any provider in the dependency chain fails to initialize.
         SelfDependencyError: If called from within the same provider's initialize() method.
-        CircularDependencyError: If circular dependencies are detected.
         
     Note:
         - Works with both synchronous and asynchronous methods
@@ -199,124 +329,20 @@ def guarded(
                 yield user
         ```
     """
-    # We perform all actions related to evaluation and initialization of
-    # the dependencies at runtime, when the decorated method is called.
-    # This is because we want to make sure that the developer had a chance
-    # to declare everything before running and we know the full picture.
-
-    def _validate(
-        cls: type[_T],
-        method: Callable[Concatenate[type[_T], _P], _R],
-    ) -> type[BaseProvider]:
-        """Get the class of the decorated method.
-
-        Raises:
-            `ValueError`: If the function is not a method of the class
-            or the class is not a subclass of BaseProvider.
-        """
-        if not issubclass(cls, BaseProvider):
-            raise ValueError(
-                f"Class '{cls.__name__}' for the method "
-                f"{method.__qualname__} is not a subclass of BaseProvider."
-            ) 
-
-        # Ensure the function is actually part of this class. This check is
-        # important because __qualname__ could be misleading if a function
-        # is defined inside another function within a class, though that's a
-        # rare case for methods. We're assuming decorated functions are
-        # direct attributes of the class or its instances.
-        if not hasattr(cls, method.__name__):
-            raise ValueError(
-                f"Function {method.__qualname__} is not a method of "
-                f"class {cls.__name__}."
-            )
-
-    def _raise_on_self_dependency(cls: type) -> None:
-        frame = inspect.currentframe()
-        try:
-            while frame:
-                if frame.f_code.co_qualname.endswith(
-                    f"{cls.__name__}.initialize",
-                ):
-                    raise SelfDependencyError(
-                        f"Guarded method {func.__qualname__} was invoked "
-                        "inside the initialize() method of its class "
-                        f"{cls.__name__}. Guarded methods cannot "
-                        "be called from the initialize() method."
-                    )
-                frame = frame.f_back
-        finally:
-            del frame
-
-    def _initialize_all(
-        cls: _BaseProviderT,
-        requested_for: str | None = None,
-    ) -> None:
-        logger.debug(
-            f"Singleton {cls.__name__} requires initialization"
-            f"{' for ' + requested_for if requested_for else ''}"
-        )
-        # Check for circular dependencies
-        cls._raise_on_circular_dependencies()
-
-        # Raise an error if the @guarded decorator function is called
-        # from the initialize method of the provider.
-        _raise_on_self_dependency(cls)
-
-        # Make sure all dependencies of this provider are initialized
-        init_order = cls._get_initialization_order()
-        logger.debug(
-            f"Initialization order for {cls.__name__} is "
-            f"{', '.join(provider.__name__ for provider in init_order)}"
-        )
-        for dep in init_order:
-            if dep._initialized:
-                logger.debug(
-                    f"Dependency {dep.__name__} of "
-                    f"{cls.__name__} is already initialized"
-                )
-            else:
-                try:
-                    dep._initialize_impl()
-                except Exception as e:
-                    who = cls.__name__
-                    why = dep.__name__
-                    cause = f" because of {why}" if who != why else ""
-                    raise ProviderInitializationError(
-                        f"Failed to initialize {who}{cause}: {e}"
-                    ) from e
-                    
-    def _wrap(
-        f: Callable[Concatenate[type[_T], _P], _R]
-    ) -> Callable[Concatenate[type[_T], _P], _R]:
-        if inspect.iscoroutinefunction(f):
-            @wraps(f)
-            async def async_wrapper(
-                cls: _BaseProviderT, *args: _P.args, **kwargs: _P.kwargs
-            ) -> _R:  # type: ignore[override]
-                _validate(cls, f)
-                if not cls._initialized:
-                    _initialize_all(cls)
-                return await f(cls, *args, **kwargs)
+    # The initialization order is resolved when the provider class is
+    # defined. Initialization itself happens at runtime, when the decorated
+    # method is called for the first time. The guard logic lives in module
+    # level helpers shared by all guarded methods; only the thin wrapper
+    # returned by _wrap is created per method.
 
-            return async_wrapper  # type: ignore[return-value]
-
-        @wraps(f)
-        def sync_wrapper(
-            cls: _BaseProviderT, *args: _P.args, **kwargs: _P.kwargs
-        ) -> _R:  # type: ignore[override]
-            _validate(cls, f)
-            if not cls._initialized:
-                _initialize_all(cls)
-            return f(cls, *args, **kwargs)
-
-        return sync_wrapper  # type: ignore[return-value]
-    
     # Unwrap if we received an already decorated class method
     func_ = func.__func__ if isinstance(func, classmethod) else func  # type: ignore[arg-type]
 
+    # Decide once whether the method is sync or async
+    is_coroutine = inspect.iscoroutinefunction(func_)
+
     # Add guard logic
-    guarded_func = _wrap(func_)  # type: ignore[arg-type]
+    guarded_func = _wrap(func_, is_coroutine)  # type: ignore[arg-type]
 
     # Hand it back as a class method descriptor
-    return Guarded(guarded_func)  # type: ignore[return-value]
+    return Guarded(guarded_func, is_coroutine)  # type: ignore[return-value]
@@ -35,10 +35,14 @@ def requires(
         *dependencies: Variable number of provider classes that this provider
         depends on. Each must be a subclass of BaseProvider.
         
+    Raises:
+        CircularDependencyError: If the dependencies form a cycle.
+        
     Note:
-        - Circular dependencies will be detected and raise CircularDependencyError
+        - Circular dependencies are detected when the decorator is applied
         - Dependencies are initialized recursively (dependencies of dependencies)
-        - The order of dependencies in the decorator doesn't matter
+        - Dependencies are always initialized before the provider; independent
+          dependencies are initialized in the order they are declared
     
     Example:
 
@@ -89,7 +93,6 @@ class guarded(Generic[_T, _P, _R_co]):
     Raises:
         ProviderInitializationError: If any provider in the dependency chain fails to initialize.
         SelfDependencyError: If called from within the same provider's initialize() method.
-        CircularDependencyError: If circular dependencies are detected.
         
     Note:
         - Works with both synchronous and asynchronous methods
@@ -168,8 +168,9 @@ class SelfDependencyError(ProviderError):
     other @guarded methods from the same provider. This is not allowed
     because it would create a dependency cycle within the provider itself.
     
-    The framework detects this pattern by inspecting the call stack and
-    raises this error to prevent infinite recursion.
+    The framework detects this pattern by tracking which providers are
+    currently being initialized and raises this error to prevent infinite
+    recursion.
     
     Example:
         This would cause a SelfDependencyError:
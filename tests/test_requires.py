@@ -0,0 +1,72 @@
+import gc
+import weakref
+
+import pytest
+
+from singleton_provider import BaseProvider, guarded, requires
+from singleton_provider.exceptions import CircularDependencyError
+
+
+def _make_provider(name: str, log: list[str]) -> type[BaseProvider]:
+    def initialize(cls) -> None:
+        log.append(cls.__name__)
+
+    def get(cls) -> str:
+        return cls.__name__
+
+    return type(name, (BaseProvider,), {
+        "initialize": classmethod(initialize),
+        "get": guarded(get),
+    })
+
+
+def test_requires_refreshes_order_of_dependents():
+    log: list[str] = []
+    a = _make_provider("A", log)
+    b = requires(a)(_make_provider("B", log))
+    c = requires(b)(_make_provider("C", log))
+    d = _make_provider("D", log)
+
+    requires(d)(a)
+
+    assert c._initialization_order == (d, a, b, c)
+    assert c.get() == "C"
+    assert log == ["D", "A", "B", "C"]
+
+
+def test_requires_refreshes_order_of_inheriting_subclasses():
+    log: list[str] = []
+    parent = _make_provider("Parent", log)
+    child = type("Child", (parent,), {})
+    d = _make_provider("D", log)
+
+    requires(d)(parent)
+
+    assert child._dependencies == (d,)
+    assert child._initialization_order == (d, child)
+
+
+def test_requires_leaves_providers_unchanged_on_cycle_through_dependents():
+    log: list[str] = []
+    a = _make_provider("A", log)
+    b = requires(a)(_make_provider("B", log))
+    c = requires(b)(_make_provider("C", log))
+
+    with pytest.raises(CircularDependencyError, match="A -> C -> B -> A"):
+        requires(c)(a)
+
+    assert a._dependencies == ()
+    assert a._initialization_order == (a,)
+    assert c._initialization_order == (a, b, c)
+    assert c.get() == "C"
+    assert log == ["A", "B", "C"]
+
+
+def test_requires_does_not_keep_dependents_alive():
+    log: list[str] = []
+    db = _make_provider("DB", log)
+    ref = weakref.ref(requires(db)(_make_provider("Users", log)))
+
+    gc.collect()
+
+    assert ref() is None